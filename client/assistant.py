@@ -15,6 +15,20 @@ from .audio import AudioCapture
 load_dotenv()
 log = structlog.get_logger()
 
+# Optional faster event loop (libuv); falls back to the stdlib loop
+try:
+    import uvloop
+    # uvloop.run() only exists in uvloop >= 0.18; older installs use asyncio.run
+    UVLOOP_AVAILABLE = hasattr(uvloop, "run")
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+# Mode and command vocab, checked once per turn
+TYPED_INPUT_MODES = frozenset({"text-only", "no-stt"})
+SILENT_MODES = frozenset({"text-only", "no-tts"})
+EXIT_WORDS = frozenset({"exit", "quit", "bye", "goodbye"})
+
 
 class VoiceAssistant:
     """Voice assistant with STT, TTS, and dynamic MCP tool execution."""
@@ -47,10 +61,40 @@ Be concise since responses will be spoken aloud."""
         
         if not self.api_key:
             raise ValueError("XAI_API_KEY environment variable not set")
+        
+        # Request headers are fixed for the session; build them once
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+        self._session = None  # Created lazily inside the event loop
     
     def run(self):
-        """Run the assistant."""
-        asyncio.run(self._main_loop())
+        """Run the assistant (on uvloop when installed)."""
+        if UVLOOP_AVAILABLE:
+            uvloop.run(self._run())
+        else:
+            asyncio.run(self._run())
+    
+    async def _run(self):
+        """Run the conversation loop, releasing shared connections on exit."""
+        try:
+            await self._main_loop()
+        finally:
+            await self.close()
+    
+    def _get_session(self):
+        """One HTTP session for STT, chat and TTS so calls to api.x.ai share a connection pool."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP and MCP sessions and release the microphone."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        await self.mcp_client.close()
+        self.audio.close()
     
     async def _main_loop(self):
         """Main conversation loop."""
@@ -64,7 +108,7 @@ Be concise since responses will be spoken aloud."""
         while True:
             try:
                 # Get input
-                if self.mode in ["text-only", "no-stt"]:
+                if self.mode in TYPED_INPUT_MODES:
                     user_input = input("💬 Your message: ").strip()
                 else:
                     user_input = await self._listen()
@@ -73,7 +117,7 @@ Be concise since responses will be spoken aloud."""
                     print("⚠️  No input detected, try again")
                     continue
                 
-                if user_input.lower() in ["exit", "quit", "bye", "goodbye"]:
+                if user_input.lower() in EXIT_WORDS:
                     print("👋 Goodbye!")
                     break
                 
@@ -89,7 +133,7 @@ Be concise since responses will be spoken aloud."""
                 
                 # Output
                 print(f"\n💬 Response:\n{response}\n")
-                if self.mode not in ["text-only", "no-tts"]:
+                if self.mode not in SILENT_MODES:
                     await self._speak(response)
                 
                 # Update history
@@ -119,19 +163,19 @@ Be concise since responses will be spoken aloud."""
             form_data.add_field('file', audio_data, filename='audio.wav', content_type='audio/wav')
             form_data.add_field('model', 'grok-2-vision-1212')
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.x.ai/v1/audio/transcriptions",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    data=form_data
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("text", "") or None
-                    else:
-                        print(f"   STT Error: {resp.status}")
-                        return input("💬 Type instead: ").strip()
-                        
+            session = self._get_session()
+            async with session.post(
+                "https://api.x.ai/v1/audio/transcriptions",
+                headers=self._auth_headers,
+                data=form_data
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    return data.get("text", "") or None
+                else:
+                    print(f"   STT Error: {resp.status}")
+                    return input("💬 Type instead: ").strip()
+                    
         except Exception as e:
             log.error("stt.error", error=str(e))
             return input("💬 Type instead: ").strip()
@@ -139,68 +183,63 @@ Be concise since responses will be spoken aloud."""
     async def _ask_grok(self, query: str) -> Optional[str]:
         """Query Grok with dynamic tool execution."""
         try:
-            import aiohttp
-            
             messages = [{"role": "system", "content": self.system_prompt}]
             messages.extend(self.conversation_history)
             messages.append({"role": "user", "content": query})
             
-            async with aiohttp.ClientSession() as session:
-                for iteration in range(100):
-                    payload = {
-                        "model": self.model,
-                        "messages": messages,
-                        "tools": self.tools
-                    }
+            session = self._get_session()
+            for iteration in range(100):
+                payload = {
+                    "model": self.model,
+                    "messages": messages,
+                    "tools": self.tools
+                }
+                
+                print(f"   📡 Calling Grok API (iteration {iteration + 1})...")
+                
+                async with session.post(
+                    "https://api.x.ai/v1/chat/completions",
+                    headers=self._json_headers,
+                    json=payload
+                ) as resp:
+                    if resp.status != 200:
+                        error = await resp.text()
+                        return f"Error: {resp.status}"
                     
-                    print(f"   📡 Calling Grok API (iteration {iteration + 1})...")
+                    data = await resp.json()
+                    choice = data.get("choices", [{}])[0]
+                    message = choice.get("message", {})
+                    tool_calls = message.get("tool_calls", [])
                     
-                    async with session.post(
-                        "https://api.x.ai/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json=payload
-                    ) as resp:
-                        if resp.status != 200:
-                            error = await resp.text()
-                            return f"Error: {resp.status}"
-                        
-                        data = await resp.json()
-                        choice = data.get("choices", [{}])[0]
-                        message = choice.get("message", {})
-                        tool_calls = message.get("tool_calls", [])
+                    if tool_calls:
+                        messages.append(message)
                         
-                        if tool_calls:
-                            messages.append(message)
+                        for tool_call in tool_calls:
+                            tool_name = tool_call.get("function", {}).get("name", "")
+                            tool_args_str = tool_call.get("function", {}).get("arguments", "{}")
                             
-                            for tool_call in tool_calls:
-                                tool_name = tool_call.get("function", {}).get("name", "")
-                                tool_args_str = tool_call.get("function", {}).get("arguments", "{}")
-                                
-                                print(f"   🔧 Tool: {tool_name}")
-                                try:
-                                    tool_args = json.loads(tool_args_str)
-                                except:
-                                    tool_args = {}
-                                
-                                result = await self.mcp_client.call_tool(tool_name, tool_args)
-                                result_str = json.dumps(result) if isinstance(result, dict) else str(result)
-                                
-                                print(f"      ✅ Result: {result_str[:100]}...")
-                                
-                                messages.append({
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.get("id", ""),
-                                    "content": result_str
-                                })
-                            continue
-                        
-                        return message.get("content", "No response")
-                
-                return "Max iterations reached"
-                
+                            print(f"   🔧 Tool: {tool_name}")
+                            try:
+                                tool_args = json.loads(tool_args_str)
+                            except:
+                                tool_args = {}
+                            
+                            result = await self.mcp_client.call_tool(tool_name, tool_args)
+                            result_str = json.dumps(result) if isinstance(result, dict) else str(result)
+                            
+                            print(f"      ✅ Result: {result_str[:100]}...")
+                            
+                            messages.append({
+                                "role": "tool",
+                                "tool_call_id": tool_call.get("id", ""),
+                                "content": result_str
+                            })
+                        continue
+                    
+                    return message.get("content", "No response")
+            
+            return "Max iterations reached"
+            
         except Exception as e:
             log.error("grok.error", error=str(e))
             return f"Error: {e}"
@@ -208,37 +247,33 @@ Be concise since responses will be spoken aloud."""
     async def _speak(self, text: str):
         """Text to speech."""
         try:
-            import aiohttp
             import subprocess
             import tempfile
             
             print("   🔊 Generating speech...")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.x.ai/v1/audio/speech",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "input": text,
-                        "voice": self.voice.capitalize(),
-                        "response_format": "mp3"
-                    }
-                ) as resp:
-                    if resp.status == 200:
-                        audio = await resp.read()
-                        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                            f.write(audio)
-                            temp_path = f.name
-                        
-                        try:
-                            subprocess.run(['afplay', temp_path], check=True)
-                        finally:
-                            os.unlink(temp_path)
-                    else:
-                        print(f"   ⚠️ TTS Error: {resp.status}")
-                        
+            session = self._get_session()
+            async with session.post(
+                "https://api.x.ai/v1/audio/speech",
+                headers=self._json_headers,
+                json={
+                    "input": text,
+                    "voice": self.voice.capitalize(),
+                    "response_format": "mp3"
+                }
+            ) as resp:
+                if resp.status == 200:
+                    # Stream straight to disk instead of buffering the whole clip in memory
+                    f = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
+                    try:
+                        with f:
+                            async for chunk in resp.content.iter_chunked(64 * 1024):
+                                f.write(chunk)
+                        subprocess.run(['afplay', f.name], check=True)
+                    finally:
+                        os.unlink(f.name)
+                else:
+                    print(f"   ⚠️ TTS Error: {resp.status}")
+                    
         except Exception as e:
             log.error("tts.error", error=str(e))
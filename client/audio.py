@@ -4,11 +4,17 @@ v3.2 - Auto-calibrates to room noise and visualizes recording levels.
 """
 import io
 import math
+import operator
 import struct
+import sys
+import time
 import structlog
 
 log = structlog.get_logger()
 
+# Minimum seconds between live level-meter redraws (~10 Hz)
+REDRAW_INTERVAL = 0.1
+
 # Optional imports
 try:
     import pyaudio
@@ -28,6 +34,19 @@ class AudioCapture:
         self.chunk_size = chunk_size
         self.silence_threshold = 500  # Default, will calibrate
         self.calibrated = False
+        
+        # Timing limits in chunks, fixed for the lifetime of the capture config
+        self.chunks_per_second = sample_rate / chunk_size
+        self.max_silence = int(1.5 * self.chunks_per_second)
+        self.max_frames = int(30 * self.chunks_per_second)  # 30s max
+        self.no_speech_timeout = int(5 * self.chunks_per_second)
+        
+        # Precompiled unpacker for a full chunk of 16-bit mono samples
+        self._chunk_struct = struct.Struct(f'{chunk_size}h')
+        
+        # PortAudio handle and input stream, opened once and reused across turns
+        self._pa = None
+        self._stream = None
     
     def calibrate(self, stream, seconds: float = 1.0) -> None:
         """Measure background noise to set adaptive threshold."""
@@ -56,10 +75,13 @@ class AudioCapture:
         if not data:
             return 0.0
         try:
-            samples = struct.unpack(f'{len(data) // 2}h', data)
+            if len(data) == self._chunk_struct.size:
+                samples = self._chunk_struct.unpack(data)
+            else:
+                samples = struct.unpack(f'{len(data) // 2}h', data)
             if not samples:
                 return 0.0
-            return math.sqrt(sum(s ** 2 for s in samples) / len(samples))
+            return math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples))
         except Exception:
             return 0.0
     
@@ -69,21 +91,11 @@ class AudioCapture:
             log.error("audio.not_available")
             return None
         
-        p = pyaudio.PyAudio()
-        
-        try:
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-        except Exception as e:
-            log.error("audio.open_failed", error=str(e))
-            p.terminate()
+        stream = self._open_stream()
+        if stream is None:
             return None
         
+        wf = None
         try:
             # Calibrate on first use
             if not self.calibrated:
@@ -91,35 +103,47 @@ class AudioCapture:
             
             print("🎤 Ready...", end="", flush=True)
             
-            frames = []
+            # Encode into the WAV container as chunks arrive instead of
+            # buffering a frame list and joining it after recording
+            buffer = io.BytesIO()
+            wf = wave.open(buffer, 'wb')
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            write_frames = wf.writeframesraw
+            
+            recorded = 0
             silent_chunks = 0
             has_spoken = False
             
-            # Timing calculations
-            chunks_per_second = self.sample_rate / self.chunk_size
-            max_silence = int(1.5 * chunks_per_second)
-            max_frames = int(30 * chunks_per_second)  # 30s max
-            no_speech_timeout = int(5 * chunks_per_second)
+            max_silence = self.max_silence
+            max_frames = self.max_frames
+            no_speech_timeout = self.no_speech_timeout
             
-            while len(frames) < max_frames:
+            # Loop invariants, bound once instead of looked up per chunk
+            read = stream.read
+            chunk_size = self.chunk_size
+            calculate_rms = self._calculate_rms
+            threshold = self.silence_threshold
+            # Scale bar relative to threshold
+            scale = max(threshold * 2, 1000)
+            write = sys.stdout.write
+            flush = sys.stdout.flush
+            last_draw = 0.0
+            
+            while recorded < max_frames:
                 try:
-                    data = stream.read(self.chunk_size, exception_on_overflow=False)
+                    data = read(chunk_size, exception_on_overflow=False)
                 except Exception:
                     continue
                 
-                frames.append(data)
-                rms = self._calculate_rms(data)
+                write_frames(data)
+                recorded += 1
+                rms = calculate_rms(data)
                 
-                # --- VISUALIZATION LOGIC ---
-                # Scale bar relative to threshold
-                scale = max(self.silence_threshold * 2, 1000)
-                level = min(int((rms / scale) * 20), 20)
-                bar = "█" * level + "░" * (20 - level)
-                
-                duration = len(frames) / chunks_per_second
                 status = "Listening"
                 
-                if rms > self.silence_threshold:
+                if rms > threshold:
                     has_spoken = True
                     silent_chunks = 0
                     status = "Speaking "
@@ -128,36 +152,82 @@ class AudioCapture:
                     if has_spoken:
                         status = "Silence  "
                 
-                # Live update line
-                print(f"\r🎤 {status} [{bar}] {duration:.1f}s", end="", flush=True)
+                # --- VISUALIZATION LOGIC ---
+                # Redraw at most every REDRAW_INTERVAL
+                now = time.monotonic()
+                if now - last_draw >= REDRAW_INTERVAL:
+                    write(self._meter_line(status, rms, scale, recorded))
+                    flush()
+                    last_draw = now
                 # ---------------------------
                 
                 # Stop conditions
                 if has_spoken and silent_chunks > max_silence:
                     break
-                if not has_spoken and len(frames) > no_speech_timeout:
-                    print("\n⚠️  Timeout: No speech detected")
-                    return None
+                if not has_spoken and recorded > no_speech_timeout:
+                    break
             
+            # Final redraw so the last status and duration aren't left stale
+            if recorded:
+                write(self._meter_line(status, rms, scale, recorded))
             print()  # Move to next line
             
-            if not has_spoken:
+            if not has_spoken and recorded > no_speech_timeout:
+                print("⚠️  Timeout: No speech detected")
                 return None
             
-            # Convert to WAV
-            buffer = io.BytesIO()
-            with wave.open(buffer, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(b''.join(frames))
+            if not has_spoken:
+                return None
             
+            # Closing patches the WAV header with the final frame count
+            wf.close()
             return buffer.getvalue()
             
         finally:
+            if wf is not None:
+                wf.close()
+            # Pause rather than close so the next turn skips PortAudio setup
             stream.stop_stream()
-            stream.close()
-            p.terminate()
+    
+    def _meter_line(self, status: str, rms: float, scale: float, recorded: int) -> str:
+        """Render the live level meter line for the current chunk."""
+        level = min(int((rms / scale) * 20), 20)
+        bar = "█" * level + "░" * (20 - level)
+        duration = recorded / self.chunks_per_second
+        return f"\r🎤 {status} [{bar}] {duration:.1f}s"
+    
+    def _open_stream(self):
+        """Return a started input stream, creating PyAudio and the stream on first use."""
+        try:
+            if self._pa is None:
+                self._pa = pyaudio.PyAudio()
+            if self._stream is None:
+                self._stream = self._pa.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=self.sample_rate,
+                    input=True,
+                    frames_per_buffer=self.chunk_size
+                )
+            elif self._stream.is_stopped():
+                self._stream.start_stream()
+            return self._stream
+        except Exception as e:
+            log.error("audio.open_failed", error=str(e))
+            self.close()
+            return None
+    
+    def close(self) -> None:
+        """Release the input stream and PortAudio."""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
     
     def is_available(self) -> bool:
         """Check if audio capture is available."""
@@ -15,6 +15,62 @@ class MCPClient:
     def __init__(self, server_url: str):
         self.server_url = server_url
         self._tools_cache: List[Dict] = []
+        self._client = None  # Connected fastmcp Client, reused across calls
+    
+    async def _get_client(self):
+        """Open the MCP session on first use and keep it for later calls."""
+        if self._client is None:
+            from fastmcp import Client
+            
+            client = Client(self.server_url)
+            await client.__aenter__()
+            self._client = client
+        return self._client
+    
+    async def _reset(self):
+        """Drop a session that failed so the next call reconnects."""
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception:
+                pass
+    
+    async def close(self):
+        """Close the MCP session."""
+        await self._reset()
+    
+    async def _connected_client(self):
+        """
+        Return a live session, pinging a reused one first. If the ping or the
+        connect fails (server restart, expiry, dropped transport), reconnect once.
+        Nothing has been sent for the caller's request yet, so this is safe to retry.
+        """
+        try:
+            if self._client is not None:
+                await self._client.ping()
+            return await self._get_client()
+        except Exception as e:
+            log.warning("mcp.reconnecting", error=str(e))
+            await self._reset()
+            return await self._get_client()
+    
+    async def _with_reconnect(self, op):
+        """
+        Run a side-effect-free `op(client)`, retrying once on a fresh session.
+        Don't use for tool calls: a failure may come after the tool already ran.
+        """
+        try:
+            return await op(await self._connected_client())
+        except Exception as e:
+            log.warning("mcp.retrying", error=str(e))
+            await self._reset()
+        
+        try:
+            return await op(await self._get_client())
+        except Exception:
+            await self._reset()
+            raise
     
     async def get_adaptable_tools(self) -> List[Dict]:
         """
@@ -22,26 +78,23 @@ class MCPClient:
         Returns tools in OpenAI/Grok function-calling format.
         """
         try:
-            from fastmcp import Client
+            tools = await self._with_reconnect(lambda client: client.list_tools())
             
-            async with Client(self.server_url) as client:
-                tools = await client.list_tools()
-                
-                # Transform FastMCP schema -> OpenAI/Grok function schema
-                self._tools_cache = [
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": tool.name,
-                            "description": tool.description or "No description",
-                            "parameters": tool.inputSchema or {"type": "object", "properties": {}}
-                        }
+            # Transform FastMCP schema -> OpenAI/Grok function schema
+            self._tools_cache = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description or "No description",
+                        "parameters": tool.inputSchema or {"type": "object", "properties": {}}
                     }
-                    for tool in tools
-                ]
-                
-                log.info("mcp.tools_discovered", count=len(self._tools_cache))
-                return self._tools_cache
+                }
+                for tool in tools
+            ]
+            
+            log.info("mcp.tools_discovered", count=len(self._tools_cache))
+            return self._tools_cache
                 
         except Exception as e:
             log.error("mcp.discovery_failed", error=str(e))
@@ -55,27 +108,27 @@ class MCPClient:
     async def call_tool(self, tool_name: str, arguments: Dict) -> Any:
         """Execute a tool on the MCP server."""
         try:
-            from fastmcp import Client
+            # Only session setup is retried; the call itself is sent once
+            client = await self._connected_client()
+            result = await client.call_tool(tool_name, arguments)
+            log.info("mcp.call_tool.success", tool=tool_name)
             
-            async with Client(self.server_url) as client:
-                result = await client.call_tool(tool_name, arguments)
-                log.info("mcp.call_tool.success", tool=tool_name)
-                
-                # Parse FastMCP result format
-                if hasattr(result, 'content') and result.content:
-                    content = result.content
-                    if isinstance(content, list) and len(content) > 0:
-                        item = content[0]
-                        if hasattr(item, 'text'):
-                            text = item.text
-                            try:
-                                return json.loads(text)
-                            except:
-                                return {"result": text}
-                        return {"result": str(item)}
-                    return {"result": str(content)}
-                return {"result": str(result)}
+            # Parse FastMCP result format
+            if hasattr(result, 'content') and result.content:
+                content = result.content
+                if isinstance(content, list) and len(content) > 0:
+                    item = content[0]
+                    if hasattr(item, 'text'):
+                        text = item.text
+                        try:
+                            return json.loads(text)
+                        except:
+                            return {"result": text}
+                    return {"result": str(item)}
+                return {"result": str(content)}
+            return {"result": str(result)}
                 
         except Exception as e:
             log.error("mcp.call_tool.error", tool=tool_name, error=str(e))
+            await self._reset()  # The next call reconnects
             return {"error": str(e)}
@@ -8,6 +8,7 @@ import asyncio
 import time
 import json
 import atexit
+import signal
 import structlog
 import aiohttp
 from pathlib import Path
@@ -17,8 +18,42 @@ from typing import Dict, List, Optional
 
 log = structlog.get_logger()
 
+# Static GitHub headers, built once per process; only the token varies per call
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_BASE_HEADERS = (
+    ("Accept", "application/vnd.github.v3+json"),
+    ("User-Agent", "claude-code-mcp"),
+)
 
-@dataclass
+# Per-call deadlines: short for metadata-style API calls, longer for shell commands
+GITHUB_TIMEOUT = aiohttp.ClientTimeout(total=30)
+RAW_COMMAND_TIMEOUT = 60
+MAX_RAW_COMMAND_TIMEOUT = 600
+
+# Ordered (marker file, project type) pairs - first match wins
+PROJECT_MARKERS = (
+    ("package.json", "node"),
+    ("pyproject.toml", "python"),
+    ("setup.py", "python"),
+    ("Cargo.toml", "rust"),
+    ("go.mod", "go"),
+    ("Makefile", "make"),
+    ("Dockerfile", "docker"),
+)
+
+# Command aliases that mean "use the project's suggested command"
+RUN_ALIASES = frozenset({"run", "start", "dev"})
+
+# Project types whose run command doesn't depend on the files present
+STATIC_COMMANDS = {
+    "rust": "cargo run",
+    "go": "go run .",
+    "make": "make",
+    "docker": "docker-compose up",
+}
+
+
+@dataclass(slots=True)
 class Project:
     """Discovered project with smart metadata."""
     name: str
@@ -29,13 +64,13 @@ class Project:
     suggested_cmd: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     """Running process metadata."""
     pid: int
     cmd: str
     project: str
-    started_at: float
+    started_at: float  # time.monotonic(), only used for runtime deltas
     status: str = "running"
     exit_code: Optional[int] = None
 
@@ -46,6 +81,8 @@ class Engine:
     def __init__(self):
         self.projects: Dict[str, Project] = {}
         self.processes: Dict[int, ProcessInfo] = {}
+        # Pooled HTTP session for GitHub calls, created lazily inside the server loop
+        self._github_http: Optional[aiohttp.ClientSession] = None
         # Register cleanup on shutdown
         atexit.register(self._cleanup_sync)
     
@@ -107,18 +144,9 @@ class Engine:
     
     def _detect_type(self, path: Path) -> str:
         """Detect project type from config files."""
-        if (path / "package.json").exists():
-            return "node"
-        if (path / "pyproject.toml").exists() or (path / "setup.py").exists():
-            return "python"
-        if (path / "Cargo.toml").exists():
-            return "rust"
-        if (path / "go.mod").exists():
-            return "go"
-        if (path / "Makefile").exists():
-            return "make"
-        if (path / "Dockerfile").exists():
-            return "docker"
+        for marker, ptype in PROJECT_MARKERS:
+            if (path / marker).exists():
+                return ptype
         return "unknown"
     
     def _get_git_remote(self, path: Path) -> Optional[str]:
@@ -168,17 +196,7 @@ class Engine:
                 if (path / "app.py").exists():
                     return "python app.py"
             
-            if ptype == "rust":
-                return "cargo run"
-            
-            if ptype == "go":
-                return "go run ."
-            
-            if ptype == "make":
-                return "make"
-            
-            if ptype == "docker":
-                return "docker-compose up"
+            return STATIC_COMMANDS.get(ptype)
                 
         except Exception:
             pass
@@ -224,7 +242,7 @@ class Engine:
         project = self.projects[project_name]
         
         # Smart: if user just says "run", use suggested command
-        if command.lower() in ("run", "start", "dev"):
+        if command.lower() in RUN_ALIASES:
             if project.suggested_cmd:
                 command = project.suggested_cmd
                 log.info("exec.smart", using=command)
@@ -246,7 +264,7 @@ class Engine:
                 pid=proc.pid,
                 cmd=command,
                 project=project_name,
-                started_at=time.time()
+                started_at=time.monotonic()
             )
             
             # Quick timeout for immediate feedback
@@ -264,24 +282,40 @@ class Engine:
             log.error("exec.failed", error=str(e))
             return f"❌ Failed: {str(e)}"
     
-    async def run_raw(self, command: str, cwd: str = ".") -> str:
-        """Execute a raw shell command in any directory."""
-        log.info("exec.raw", cmd=command, cwd=cwd)
+    async def run_raw(
+        self, command: str, cwd: str = ".", timeout: int = RAW_COMMAND_TIMEOUT
+    ) -> str:
+        """Execute a raw shell command in any directory, bounded by `timeout` seconds."""
+        log.info("exec.raw", cmd=command, cwd=cwd, timeout=timeout)
+        
+        if not 0 < timeout <= MAX_RAW_COMMAND_TIMEOUT:
+            return (
+                f"❌ Error: timeout must be between 1 and "
+                f"{MAX_RAW_COMMAND_TIMEOUT}s (got {timeout})"
+            )
         
         try:
             proc = await asyncio.create_subprocess_shell(
                 command,
                 cwd=os.path.expanduser(cwd),
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group, so a timeout can kill the whole pipeline
+                start_new_session=True
             )
             
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
             output = stdout.decode().strip() or stderr.decode().strip()
             return f"Exit code: {proc.returncode}\n{output[:3000]}"
             
         except asyncio.TimeoutError:
-            return "⏱️ Command timed out (60s)"
+            # Don't leave the command (or its children) running and unreaped
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            return f"⏱️ Command timed out ({timeout}s), killed"
         except Exception as e:
             return f"❌ Error: {str(e)}"
     
@@ -299,8 +333,9 @@ class Engine:
             stats = {"error": "psutil not installed"}
         
         lines = [json.dumps(stats, indent=2), "", "Tracked Processes:"]
+        now = time.monotonic()
         for pid, info in self.processes.items():
-            runtime = time.time() - info.started_at
+            runtime = now - info.started_at
             lines.append(f"  PID {pid}: {info.cmd[:40]} [{info.status}] ({runtime:.0f}s)")
         
         return "\n".join(lines)
@@ -338,26 +373,37 @@ class Engine:
     # GITHUB API
     # =========================================================================
     
+    def _github_session(self) -> aiohttp.ClientSession:
+        """Reuse one session so repeated API calls keep their TCP/TLS connection alive."""
+        if self._github_http is None or self._github_http.closed:
+            self._github_http = aiohttp.ClientSession(timeout=GITHUB_TIMEOUT)
+        return self._github_http
+    
+    async def close(self):
+        """Close the pooled GitHub session (called from the server's shutdown)."""
+        if self._github_http is not None and not self._github_http.closed:
+            await self._github_http.close()
+        self._github_http = None
+    
     async def call_github(self, method: str, endpoint: str, data: dict = None, token: str = None) -> dict:
         """Universal GitHub API caller."""
         if not token:
             return {"error": "No GH_TOKEN configured"}
         
-        url = f"https://api.github.com/{endpoint.lstrip('/')}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "claude-code-mcp"
-        }
+        url = f"{GITHUB_API_URL}/{endpoint.lstrip('/')}"
+        headers = dict(GITHUB_BASE_HEADERS, Authorization=f"Bearer {token}")
         
         log.info("github.call", method=method, endpoint=endpoint)
         
-        async with aiohttp.ClientSession() as session:
+        try:
+            session = self._github_session()
             async with session.request(method.upper(), url, headers=headers, json=data) as resp:
                 try:
                     return await resp.json()
                 except Exception:
                     return {"status": resp.status, "text": await resp.text()}
+        except asyncio.TimeoutError:
+            return {"error": f"GitHub API timed out ({GITHUB_TIMEOUT.total:.0f}s)"}
     
     # =========================================================================
     # CLAUDE AGENT
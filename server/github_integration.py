@@ -1,15 +1,23 @@
 """GitHub integration for fetching PR comments and query data"""
 
 import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
 from github import Github, Auth
 from .config import settings
 
 def _get_github_client() -> Github:
     """
-    Initialize GitHub client with authentication from settings.
+    Return the GitHub client for the configured token, shared across calls.
+    """
+    return _github_client_for(settings.GH_TOKEN)
+
+
+@lru_cache(maxsize=4)
+def _github_client_for(token: Optional[str]) -> Github:
+    """
+    Build one GitHub client per token so its HTTP session and auth are reused.
     """
-    token = settings.GH_TOKEN
     if token:
         auth = Auth.Token(token)
         return Github(auth=auth)
@@ -18,6 +26,60 @@ def _get_github_client() -> Github:
         return Github()
 
 
+def _get_pull(owner: str, repo_name: str, pr_number: int):
+    """Resolve a pull request (one repo lookup + one PR lookup)."""
+    g = _get_github_client()
+    repo = g.get_repo(f"{owner}/{repo_name}")
+    return repo.get_pull(pr_number)
+
+
+def _review_comments(pr, include_outdated: bool = False) -> List[Dict]:
+    """Build review comment dictionaries for an already-fetched PR."""
+    comments = []
+    for comment in pr.get_review_comments():
+        # Safely extract all fields with proper None handling
+        comment_dict = {
+            "id": comment.id if hasattr(comment, 'id') else None,
+            "body": comment.body if hasattr(comment, 'body') else None,
+            "user": {"login": comment.user.login} if (hasattr(comment, 'user') and comment.user) else None,
+            "created_at": comment.created_at.isoformat() if (hasattr(comment, 'created_at') and comment.created_at) else None,
+            "updated_at": comment.updated_at.isoformat() if (hasattr(comment, 'updated_at') and comment.updated_at) else None,
+            "path": comment.path if hasattr(comment, 'path') else None,
+            "position": comment.position if hasattr(comment, 'position') else None,
+            "original_position": comment.original_position if hasattr(comment, 'original_position') else None,
+            "commit_id": comment.commit_id if hasattr(comment, 'commit_id') else None,
+            "original_commit_id": comment.original_commit_id if hasattr(comment, 'original_commit_id') else None,
+            "diff_hunk": comment.diff_hunk if hasattr(comment, 'diff_hunk') else None,
+            "line": comment.line if hasattr(comment, 'line') else None,
+            "start_line": comment.start_line if hasattr(comment, 'start_line') else None,
+            "start_side": comment.start_side if hasattr(comment, 'start_side') else None,
+            "side": comment.side if hasattr(comment, 'side') else None,
+        }
+        comments.append(comment_dict)
+
+    if not include_outdated:
+        # Filter to current comments (position > 0; outdated have position = null or 0)
+        comments = [c for c in comments if c.get("position") and c.get("position") > 0]
+
+    return comments
+
+
+def _issue_comments(pr) -> List[Dict]:
+    """Build issue comment dictionaries for an already-fetched PR."""
+    comments = []
+    for comment in pr.get_issue_comments():
+        comment_dict = {
+            "id": comment.id if hasattr(comment, 'id') else None,
+            "body": comment.body if hasattr(comment, 'body') else None,
+            "user": {"login": comment.user.login} if (hasattr(comment, 'user') and comment.user) else None,
+            "created_at": comment.created_at.isoformat() if (hasattr(comment, 'created_at') and comment.created_at) else None,
+            "updated_at": comment.updated_at.isoformat() if (hasattr(comment, 'updated_at') and comment.updated_at) else None,
+        }
+        comments.append(comment_dict)
+
+    return comments
+
+
 def fetch_review_comments(owner: str, repo_name: str, pr_number: int, include_outdated: bool = False) -> List[Dict]:
     """
     Fetch review comments (comments on specific code lines) using GitHub API.
@@ -32,37 +94,7 @@ def fetch_review_comments(owner: str, repo_name: str, pr_number: int, include_ou
         List of review comment dictionaries
     """
     try:
-        g = _get_github_client()
-        repo = g.get_repo(f"{owner}/{repo_name}")
-        pr = repo.get_pull(pr_number)
-
-        comments = []
-        for comment in pr.get_review_comments():
-            # Safely extract all fields with proper None handling
-            comment_dict = {
-                "id": comment.id if hasattr(comment, 'id') else None,
-                "body": comment.body if hasattr(comment, 'body') else None,
-                "user": {"login": comment.user.login} if (hasattr(comment, 'user') and comment.user) else None,
-                "created_at": comment.created_at.isoformat() if (hasattr(comment, 'created_at') and comment.created_at) else None,
-                "updated_at": comment.updated_at.isoformat() if (hasattr(comment, 'updated_at') and comment.updated_at) else None,
-                "path": comment.path if hasattr(comment, 'path') else None,
-                "position": comment.position if hasattr(comment, 'position') else None,
-                "original_position": comment.original_position if hasattr(comment, 'original_position') else None,
-                "commit_id": comment.commit_id if hasattr(comment, 'commit_id') else None,
-                "original_commit_id": comment.original_commit_id if hasattr(comment, 'original_commit_id') else None,
-                "diff_hunk": comment.diff_hunk if hasattr(comment, 'diff_hunk') else None,
-                "line": comment.line if hasattr(comment, 'line') else None,
-                "start_line": comment.start_line if hasattr(comment, 'start_line') else None,
-                "start_side": comment.start_side if hasattr(comment, 'start_side') else None,
-                "side": comment.side if hasattr(comment, 'side') else None,
-            }
-            comments.append(comment_dict)
-
-        if not include_outdated:
-            # Filter to current comments (position > 0; outdated have position = null or 0)
-            comments = [c for c in comments if c.get("position") and c.get("position") > 0]
-
-        return comments
+        return _review_comments(_get_pull(owner, repo_name, pr_number), include_outdated)
     except Exception as e:
         print(f"Error fetching review comments: {e}", file=sys.stderr)
         import traceback
@@ -83,22 +115,7 @@ def fetch_issue_comments(owner: str, repo_name: str, pr_number: int) -> List[Dic
         List of issue comment dictionaries
     """
     try:
-        g = _get_github_client()
-        repo = g.get_repo(f"{owner}/{repo_name}")
-        pr = repo.get_pull(pr_number)
-
-        comments = []
-        for comment in pr.get_issue_comments():
-            comment_dict = {
-                "id": comment.id if hasattr(comment, 'id') else None,
-                "body": comment.body if hasattr(comment, 'body') else None,
-                "user": {"login": comment.user.login} if (hasattr(comment, 'user') and comment.user) else None,
-                "created_at": comment.created_at.isoformat() if (hasattr(comment, 'created_at') and comment.created_at) else None,
-                "updated_at": comment.updated_at.isoformat() if (hasattr(comment, 'updated_at') and comment.updated_at) else None,
-            }
-            comments.append(comment_dict)
-
-        return comments
+        return _issue_comments(_get_pull(owner, repo_name, pr_number))
     except Exception as e:
         print(f"Error fetching issue comments: {e}", file=sys.stderr)
         import traceback
@@ -124,13 +141,30 @@ def fetch_pr_comments(repo: str, pr_number: int, include_outdated: bool = False)
     except ValueError:
         raise ValueError("Repository must be in 'owner/repo' format")
 
-    review_comments = fetch_review_comments(owner, repo_name, pr_number, include_outdated)
-    issue_comments = fetch_issue_comments(owner, repo_name, pr_number)
+    result = {"review_comments": [], "issue_comments": []}
+    import traceback
+
+    # Resolve the PR once and share it between both comment fetches
+    try:
+        pr = _get_pull(owner, repo_name, pr_number)
+    except Exception as e:
+        print(f"Error fetching PR: {e}", file=sys.stderr)
+        traceback.print_exc()
+        return result
+
+    try:
+        result["review_comments"] = _review_comments(pr, include_outdated)
+    except Exception as e:
+        print(f"Error fetching review comments: {e}", file=sys.stderr)
+        traceback.print_exc()
+
+    try:
+        result["issue_comments"] = _issue_comments(pr)
+    except Exception as e:
+        print(f"Error fetching issue comments: {e}", file=sys.stderr)
+        traceback.print_exc()
 
-    return {
-        "review_comments": review_comments,
-        "issue_comments": issue_comments
-    }
+    return result
 
 
 def fetch_pr_info(repo: str, pr_number: int) -> Optional[Dict]:
@@ -150,9 +184,7 @@ def fetch_pr_info(repo: str, pr_number: int) -> Optional[Dict]:
         raise ValueError("Repository must be in 'owner/repo' format")
 
     try:
-        g = _get_github_client()
-        repository = g.get_repo(f"{owner}/{repo_name}")
-        pr = repository.get_pull(pr_number)
+        pr = _get_pull(owner, repo_name, pr_number)
 
         pr_info = {
             "id": pr.id if hasattr(pr, 'id') else None,
@@ -214,9 +246,7 @@ def respond_to_pr_comment(repo: str, pr_number: int, comment_id: int, body: str)
         raise ValueError("Repository must be in 'owner/repo' format")
 
     try:
-        g = _get_github_client()
-        repository = g.get_repo(f"{owner}/{repo_name}")
-        pr = repository.get_pull(pr_number)
+        pr = _get_pull(owner, repo_name, pr_number)
 
         # Get the review comment by ID
         comment = None
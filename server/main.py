@@ -3,12 +3,13 @@ Autonomous MCP Server - Golden Path Architecture
 Clean entry point with dynamic tools.
 """
 import json
+from contextlib import asynccontextmanager
 import structlog
 import uvicorn
 from fastmcp import FastMCP
 
 from .config import settings
-from .engine import engine
+from .engine import engine, RAW_COMMAND_TIMEOUT
 
 # Logging
 structlog.configure(
@@ -60,12 +61,13 @@ async def run_in_project(project_name: str, command: str) -> str:
 
 
 @mcp.tool()
-async def run_shell(command: str, cwd: str = "~") -> str:
+async def run_shell(command: str, cwd: str = "~", timeout: int = RAW_COMMAND_TIMEOUT) -> str:
     """
     Execute a raw shell command in any directory.
+    timeout: seconds to wait before the command is killed (max 600)
     Example: run_shell("ls -la", "~/code")
     """
-    return await engine.run_raw(command, cwd)
+    return await engine.run_raw(command, cwd, timeout)
 
 
 @mcp.tool()
@@ -185,8 +187,23 @@ def main():
 ╚══════════════════════════════════════════════════════════════╝
     """)
     
+    app = mcp.http_app()
+    
+    # Wrap the app's lifespan so pooled connections are closed once on shutdown
+    mcp_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        async with mcp_lifespan(app):
+            try:
+                yield
+            finally:
+                await engine.close()
+    
+    app.router.lifespan_context = lifespan
+    
     uvicorn.run(
-        mcp.http_app(),
+        app,
         host=settings.HOST,
         port=settings.PORT,
         log_level="warning",